@@ -1,13 +1,48 @@
 from pathlib import Path
+import math
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
+import plotly.graph_objects as go
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_PATH = BASE_DIR / "data" / "processed" / "cleaned_data.csv"
+HISTOGRAM_BINS = 50
+COLUMNS = ["triage_level", "department", "waiting_time_minutes"]
+DTYPES = {
+    "department": "category",
+    "triage_level": pd.CategoricalDtype([1, 2, 3, 4, 5]),
+    "waiting_time_minutes": "int16",
+}
 
-df = pd.read_csv(DATA_PATH)
-df["arrival_time"] = pd.to_datetime(df["arrival_time"])
+
+@st.cache_data(persist="disk", show_spinner=False)
+def load_data(path, mtime):
+    # mtime is only part of the cache key, so regenerated data is reloaded.
+    return pd.read_csv(path, usecols=COLUMNS, dtype=DTYPES)
+
+
+@st.cache_data(persist="disk", show_spinner=False)
+def compute_aggregates(path, mtime):
+    df = load_data(path, mtime)
+    waits = df["waiting_time_minutes"].to_numpy()
+    lo, hi = int(waits.min()), int(waits.max())
+    # Whole-minute bin widths so every bin covers the same number of minutes.
+    step = max(1, math.ceil((hi - lo + 1) / HISTOGRAM_BINS))
+    edges = np.arange(lo, hi + step + 1, step)
+    counts, edges = np.histogram(waits, bins=edges)
+    return {
+        "department_wait": (
+            df.groupby("department", observed=True)["waiting_time_minutes"].mean()
+        ),
+        "wait_histogram": (counts, edges),
+    }
+
+
+data_mtime = DATA_PATH.stat().st_mtime
+df = load_data(DATA_PATH, data_mtime)
+aggregates = compute_aggregates(DATA_PATH, data_mtime)
 
 st.title("🏥 Emergency Department Waiting Time Optimization")
 
@@ -23,18 +58,25 @@ with col1:
     st.plotly_chart(fig1, use_container_width=True)
 
 with col2:
-    fig2 = px.bar(
-        df.groupby("department")["waiting_time_minutes"].mean().reset_index(),
-        x="department",
-        y="waiting_time_minutes",
-        title="Average Waiting Time by Department"
+    department_wait = aggregates["department_wait"]
+    fig2 = go.Figure(
+        go.Bar(x=department_wait.index.tolist(), y=department_wait.to_numpy())
+    )
+    fig2.update_layout(
+        title="Average Waiting Time by Department",
+        xaxis_title="department",
+        yaxis_title="waiting_time_minutes"
     )
     st.plotly_chart(fig2, use_container_width=True)
 
-fig3 = px.histogram(
-    df,
-    x="waiting_time_minutes",
-    nbins=50,
-    title="Distribution of Waiting Times"
+counts, edges = aggregates["wait_histogram"]
+fig3 = go.Figure(
+    go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges))
+)
+fig3.update_layout(
+    title="Distribution of Waiting Times",
+    xaxis_title="waiting_time_minutes",
+    yaxis_title="count",
+    bargap=0
 )
 st.plotly_chart(fig3, use_container_width=True)
\ No newline at end of file
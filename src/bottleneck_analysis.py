@@ -0,0 +1,46 @@
+import pandas as pd
+
+def detect_bottlenecks(df):
+    dept_wait = (
+        df.groupby("department", observed=True, sort=False)["waiting_time_minutes"]
+        .mean()
+        .sort_values(ascending=False)
+    )
+
+    doctor_wait = (
+        df.groupby("doctor_assigned", observed=True, sort=False)["waiting_time_minutes"]
+        .mean()
+        .sort_values(ascending=False)
+    )
+
+    triage_wait = (
+        df.groupby("triage_level", observed=True, sort=False)["waiting_time_minutes"]
+        .mean()
+        .sort_index()
+    )
+
+    return {
+        "department_bottleneck": dept_wait,
+        "doctor_bottleneck": doctor_wait,
+        "triage_bottleneck": triage_wait
+    }
+
+
+if __name__ == "__main__":
+    df = pd.read_csv(
+        "data/processed/cleaned_data.csv",
+        usecols=[
+            "department",
+            "doctor_assigned",
+            "triage_level",
+            "waiting_time_minutes",
+        ],
+        dtype={
+            "department": "category",
+            "doctor_assigned": "category",
+            "triage_level": pd.CategoricalDtype([1, 2, 3, 4, 5]),
+            "waiting_time_minutes": "int16",
+        },
+    )
+    results = detect_bottlenecks(df)
+    print(results)
\ No newline at end of file
@@ -4,12 +4,13 @@ import pandas as pd
 from pathlib import Path
 
 def clean_data(filepath):
-    df = pd.read_csv(filepath)
-    df["arrival_time"] = pd.to_datetime(df["arrival_time"])
-    df = df[df["waiting_time_minutes"] >= 0]
-    df = df[df["treatment_time"] > 0]
-    df.dropna(inplace=True)
-    return df
+    df = pd.read_csv(filepath, parse_dates=["arrival_time"])
+    mask = (
+        (df["waiting_time_minutes"] >= 0)
+        & (df["treatment_time"] > 0)
+        & df.notna().all(axis=1)
+    )
+    return df[mask]
 
 
 if __name__ == "__main__":
@@ -1,44 +1,43 @@
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import random
-
-np.random.seed(42)
+from datetime import datetime
 
+SEED = 42
 NUM_PATIENTS = 5000
 
-def generate_ed_data(num_patients=NUM_PATIENTS):
+def generate_ed_data(num_patients=NUM_PATIENTS, seed=SEED):
+    rng = np.random.default_rng(seed)
     patient_ids = [f"P{100000+i}" for i in range(num_patients)]
 
     start_date = datetime(2024, 1, 1)
-    arrival_times = [
-        start_date + timedelta(minutes=random.randint(0, 60 * 24 * 180))
-        for _ in range(num_patients)
-    ]
+    arrival_offsets = rng.integers(0, 60 * 24 * 180, size=num_patients, endpoint=True)
+    arrival_times = start_date + pd.to_timedelta(arrival_offsets, unit="m")
 
-    triage_levels = np.random.choice(
+    triage_levels = rng.choice(
         [1, 2, 3, 4, 5],
         size=num_patients,
         p=[0.05, 0.15, 0.4, 0.25, 0.15]
     )
 
     departments = ["ER", "Trauma", "Cardiology", "Neurology", "Pediatrics"]
-    department_choices = np.random.choice(departments, num_patients)
+    department_choices = rng.choice(departments, num_patients)
 
     doctors = [f"Dr_{name}" for name in ["Ahmed", "Sara", "John", "Lina", "Omar"]]
-    doctor_assigned = np.random.choice(doctors, num_patients)
+    doctor_assigned = rng.choice(doctors, num_patients)
 
-    waiting_time = [
-        max(5, int(np.random.normal(120 - t * 15, 20)))
-        for t in triage_levels
-    ]
+    waiting_time = (
+        rng.normal(120 - triage_levels * 15, 20)
+        .astype(int)
+        .clip(min=5)
+    )
 
-    treatment_time = [
-        max(15, int(np.random.normal(60 + t * 20, 30)))
-        for t in triage_levels
-    ]
+    treatment_time = (
+        rng.normal(60 + triage_levels * 20, 30)
+        .astype(int)
+        .clip(min=15)
+    )
 
-    discharge_status = np.random.choice(
+    discharge_status = rng.choice(
         ["Discharged", "Admitted", "Transferred"],
         size=num_patients,
         p=[0.65, 0.25, 0.10]
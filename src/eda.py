@@ -14,5 +14,19 @@ def eda_summary(df):
 
 
 if __name__ == "__main__":
-    df = pd.read_csv("data/processed/cleaned_data.csv")
+    df = pd.read_csv(
+        "data/processed/cleaned_data.csv",
+        usecols=[
+            "triage_level",
+            "department",
+            "waiting_time_minutes",
+            "treatment_time",
+        ],
+        dtype={
+            "triage_level": pd.CategoricalDtype([1, 2, 3, 4, 5]),
+            "department": "category",
+            "waiting_time_minutes": "int16",
+            "treatment_time": "int16",
+        },
+    )
     print(eda_summary(df))
\ No newline at end of file
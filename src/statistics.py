@@ -1,17 +1,25 @@
 import pandas as pd
+import numpy as np
 from scipy.stats import f_oneway
 
 def triage_anova(df):
-    groups = [
-        df[df["triage_level"] == level]["waiting_time_minutes"]
-        for level in sorted(df["triage_level"].unique())
-    ]
+    levels = df["triage_level"].to_numpy()
+    order = np.argsort(levels, kind="stable")
+    levels = levels[order]
+    waits = df["waiting_time_minutes"].to_numpy()[order]
+
+    boundaries = np.flatnonzero(levels[1:] != levels[:-1]) + 1
+    groups = np.split(waits, boundaries)
 
     f_stat, p_value = f_oneway(*groups)
     return f_stat, p_value
 
 
 if __name__ == "__main__":
-    df = pd.read_csv("data/processed/cleaned_data.csv")
+    df = pd.read_csv(
+        "data/processed/cleaned_data.csv",
+        usecols=["triage_level", "waiting_time_minutes"],
+        dtype={"waiting_time_minutes": "int16"},
+    )
     f, p = triage_anova(df)
     print(f"F-statistic: {f}, P-value: {p}")
\ No newline at end of file